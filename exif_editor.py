@@ -3,15 +3,355 @@ import subprocess
 import datetime
 import logging
 import shlex
+import asyncio
+import atexit
+import itertools
+import json
+import queue
+import re
+import stat
+import tempfile
+import threading
 
 # Configure logging
 logging.basicConfig(level=logging.INFO, format='%(levelname)s: %(message)s')
+log = logging.getLogger(__name__)
+
+# Syntax of an EXIF 'YYYY:MM:DD HH:MM:SS' timestamp, with each field captured
+_DT_RE = re.compile(r'^(\d{4}):(\d{2}):(\d{2}) (\d{2}):(\d{2}):(\d{2})$')
+
+# Argfiles are UTF-8, but exiftool on Windows reads file names in the local code page unless told otherwise
+_CHARSET_ARGS = ['-charset', 'filename=utf8']
+
+def _argfile_text(args: list) -> str:
+    """
+    Formats arguments as exiftool argfile lines, one per line. exiftool trims argfile
+    lines, skips '#' comments and ends an argument at a line break, so any argument that
+    would be altered that way is written as a '#[CSTR]' line with C escapes instead.
+    """
+    lines = []
+    for arg in args:
+        arg = str(arg)
+        if '\n' in arg or '\r' in arg or arg.startswith('#') or arg != arg.strip():
+            escaped = arg.replace('\\', '\\\\').replace('\n', '\\n').replace('\r', '\\r').replace('\t', '\\t')
+            arg = f"#[CSTR]{escaped}"
+        lines.append(arg)
+    return "\n".join(lines) + "\n"
+
+class ExifToolDaemon:
+    """
+    Keeps a single exiftool process alive in -stay_open mode and feeds it
+    one argument list per call, avoiding a process launch for every command.
+    """
+
+    def __init__(self, command: str = "exiftool"):
+        """
+        Initializes the daemon wrapper. The process is started lazily on the first call.
+
+        Args:
+            command: The exiftool executable to launch.
+        """
+        self.command = command
+        self._process = None
+        self._pid = None # Process that started exiftool; forked children must not share its pipes
+        self._stderr_lines = None # Filled by a reader thread so a chatty stderr can't block exiftool
+        self._sequence = itertools.count(1)
+        atexit.register(self.close)
+
+    def _start(self):
+        """Launches the exiftool process reading arguments from stdin."""
+        self._process = subprocess.Popen(
+            [self.command, '-stay_open', 'True', '-@', '-'],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+        )
+        self._pid = os.getpid()
+        self._stderr_lines = queue.Queue()
+        threading.Thread(target=self._drain, args=(self._process.stderr, self._stderr_lines), daemon=True).start()
+
+    @staticmethod
+    def _drain(stream, lines: queue.Queue):
+        """Moves every line of stream into lines, ending with b'' once the stream closes."""
+        for line in iter(stream.readline, b''):
+            lines.put(line)
+        lines.put(b'')
+
+    @staticmethod
+    def _read_until(readline, sentinel: bytes) -> list[bytes]:
+        """Reads lines via readline up to (not including) the one ending with sentinel."""
+        lines = []
+        while True:
+            line = readline()
+            if not line:
+                raise EOFError("exiftool terminated unexpectedly")
+            if line.rstrip(b'\r\n').endswith(sentinel):
+                lines.append(line.rstrip(b'\r\n')[:-len(sentinel)])
+                return lines
+            lines.append(line)
+
+    def run(self, args: list) -> tuple[str, str, int]:
+        """
+        Executes one exiftool command in the running process.
+
+        Args:
+            args: A list of arguments to pass to exiftool, one per line.
+
+        Returns:
+            A tuple containing (stdout, stderr, return_code).
+        """
+        if self._process is None or self._pid != os.getpid() or self._process.poll() is not None:
+            self._start()
+
+        sequence = next(self._sequence)
+        sentinel = f"{{ready{sequence}}}".encode()
+        # -echo4 reports the command's exit status on stderr, followed by the
+        # sentinel so stderr can be drained as far as stdout.
+        lines = _CHARSET_ARGS + list(args) + ['-echo4', f"${{status}}{{ready{sequence}}}", f"-execute{sequence}"]
+        self._process.stdin.write(_argfile_text(lines).encode('utf-8'))
+        self._process.stdin.flush()
+
+        stdout_lines = self._read_until(self._process.stdout.readline, sentinel)
+        stderr_lines = self._read_until(self._stderr_lines.get, sentinel)
+
+        status = stderr_lines.pop().decode('utf-8', errors='replace').strip()
+        stdout = b''.join(stdout_lines).decode('utf-8', errors='replace')
+        stderr = b''.join(stderr_lines).decode('utf-8', errors='replace')
+        return_code = int(status) if status.isdigit() else (1 if stderr.strip() else 0)
+        return stdout, stderr, return_code
+
+    def close(self):
+        """Asks exiftool to exit and waits for the process to finish."""
+        if self._process is None or self._pid != os.getpid() or self._process.poll() is not None:
+            return
+        try:
+            self._process.stdin.write(b"-stay_open\nFalse\n")
+            self._process.stdin.flush()
+            self._process.stdin.close()
+            self._process.wait(timeout=5)
+        except (OSError, subprocess.TimeoutExpired):
+            self._process.kill()
+        finally:
+            self._process = None
+
+
+class AsyncExifToolDaemon:
+    """
+    asyncio counterpart of ExifToolDaemon that keeps several commands in flight.
+    A submitter task feeds queued commands to exiftool's stdin while reaper tasks
+    match the {readyN} sentinels on stdout/stderr to the waiting callers, so
+    exiftool never sits idle waiting for Python between commands.
+    """
+
+    def __init__(self, command: str = "exiftool"):
+        """
+        Initializes the daemon wrapper. The process is started on the first call to run().
+
+        Args:
+            command: The exiftool executable to launch.
+        """
+        self.command = command
+        self._process = None
+        self._started = None # Task launching exiftool, shared by concurrent first calls
+        self._queue = None
+        self._pending = {} # sequence -> {'future': ..., 'stdout': ..., 'stderr': ..., 'status': ...}
+        self._tasks = []
+        self._sequence = itertools.count(1)
+
+    async def _start(self):
+        """Launches exiftool and the submitter/reaper tasks."""
+        self._process = await asyncio.create_subprocess_exec(
+            self.command, '-stay_open', 'True', '-@', '-',
+            stdin=asyncio.subprocess.PIPE,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
+        )
+        self._queue = asyncio.Queue()
+        self._tasks = [
+            asyncio.create_task(self._submit()),
+            asyncio.create_task(self._reap(self._process.stdout, 'stdout')),
+            asyncio.create_task(self._reap(self._process.stderr, 'stderr')),
+        ]
+
+    async def _submit(self):
+        """Writes queued commands to exiftool, each terminated by its numbered -execute."""
+        while True:
+            sequence, args = await self._queue.get()
+            lines = _CHARSET_ARGS + list(args) + ['-echo4', f"${{status}}{{ready{sequence}}}", f"-execute{sequence}"]
+            try:
+                self._process.stdin.write(_argfile_text(lines).encode('utf-8'))
+                await self._process.stdin.drain()
+            except (OSError, RuntimeError) as e: # Broken pipe/reset, or the transport was already closed
+                self._mark_dead(EOFError(f"exiftool terminated unexpectedly: {e}"))
+                return
+
+    async def _reap(self, stream, name: str):
+        """Collects output lines from one stream and hands them to the command they belong to."""
+        sentinel = re.compile(rb'^(.*)\{ready(\d+)\}\r?\n?$')
+        lines = []
+        try:
+            while True:
+                line = await stream.readline()
+                if not line:
+                    self._mark_dead(EOFError("exiftool terminated unexpectedly"))
+                    return
+                match = sentinel.match(line)
+                if not match:
+                    lines.append(line)
+                    continue
+                if name == 'stdout':
+                    lines.append(match.group(1)) # Output without a trailing newline shares the sentinel's line
+                pending = self._pending.get(int(match.group(2)))
+                if pending is not None:
+                    pending[name] = b''.join(lines).decode('utf-8', errors='replace')
+                    if name == 'stderr':
+                        pending['status'] = match.group(1).decode('utf-8', errors='replace').strip()
+                    self._resolve(int(match.group(2)))
+                lines = []
+        except Exception as e: # e.g. a line longer than the stream's limit
+            self._mark_dead(e)
+
+    def _resolve(self, sequence: int):
+        """Completes a command's future once both its stdout and stderr have arrived."""
+        pending = self._pending[sequence]
+        if 'stdout' not in pending or 'stderr' not in pending:
+            return
+        del self._pending[sequence]
+        status = pending['status']
+        return_code = int(status) if status.isdigit() else (1 if pending['stderr'].strip() else 0)
+        if not pending['future'].done():
+            pending['future'].set_result((pending['stdout'], pending['stderr'], return_code))
+
+    def _fail_pending(self, error: Exception):
+        """Fails every command still waiting for output."""
+        for pending in self._pending.values():
+            if not pending['future'].done():
+                pending['future'].set_exception(error)
+        self._pending.clear()
+
+    def _mark_dead(self, error: Exception):
+        """
+        Fails every outstanding command and forgets the exiftool process and its tasks,
+        so the next run() starts a fresh process instead of queueing into a dead one.
+        """
+        if self._process is not None and self._process.returncode is None:
+            try:
+                self._process.kill()
+            except ProcessLookupError:
+                pass
+        current_task = asyncio.current_task()
+        for task in self._tasks:
+            if task is not current_task:
+                task.cancel()
+        self._tasks = []
+        self._process = None
+        self._started = None
+        self._fail_pending(error)
+
+    async def run(self, args: list) -> tuple[str, str, int]:
+        """
+        Queues one exiftool command and waits for its result.
+
+        Args:
+            args: A list of arguments to pass to exiftool, one per line.
+
+        Returns:
+            A tuple containing (stdout, stderr, return_code).
+        """
+        if self._started is None:
+            self._started = asyncio.ensure_future(self._start())
+        started = self._started
+        await started
+        if self._started is not started:
+            # exiftool died while this call was waiting for it to start
+            raise EOFError("exiftool terminated unexpectedly")
+        sequence = next(self._sequence)
+        future = asyncio.get_running_loop().create_future()
+        self._pending[sequence] = {'future': future}
+        await self._queue.put((sequence, args))
+        return await future
+
+    async def close(self):
+        """Asks exiftool to exit and stops the background tasks."""
+        if self._process is None:
+            return
+        try:
+            self._process.stdin.write(b"-stay_open\nFalse\n")
+            await self._process.stdin.drain()
+            self._process.stdin.close()
+            await asyncio.wait_for(self._process.wait(), timeout=5)
+        except (OSError, asyncio.TimeoutError):
+            self._process.kill()
+        finally:
+            for task in self._tasks:
+                task.cancel()
+            self._tasks = []
+            self._process = None
+            self._started = None
+
+
+_daemon = None
+
+def get_daemon() -> ExifToolDaemon:
+    """Returns the module-level exiftool daemon, creating it on first use."""
+    global _daemon
+    if _daemon is None:
+        _daemon = ExifToolDaemon(ExifEditor.EXIFTOOL_COMMAND)
+    return _daemon
+
+# Metadata read in earlier runs, keyed by absolute path and validated against size/mtime
+CACHE_PATH = os.path.join(os.path.expanduser('~'), '.cache', 'timestamper', 'exif_cache.json')
+_cache = None
+_cache_dirty = False
+_cache_enabled = True
+
+def disable_cache():
+    """
+    Stops writes from updating the metadata cache. Used in worker processes, whose
+    copy of the cache is never saved; the main process refreshes it instead.
+    """
+    global _cache_enabled
+    _cache_enabled = False
+
+def _load_cache() -> dict:
+    """Returns the metadata cache, loading it from CACHE_PATH on first use."""
+    global _cache
+    if _cache is None:
+        try:
+            with open(CACHE_PATH, encoding='utf-8') as cache_file:
+                _cache = json.load(cache_file)
+        except (OSError, ValueError):
+            _cache = {} # Missing or unreadable cache; start fresh
+    return _cache
+
+def save_cache():
+    """Writes the metadata cache back to CACHE_PATH if it changed during this run."""
+    global _cache_dirty
+    if _cache is None or not _cache_dirty:
+        return
+    try:
+        os.makedirs(os.path.dirname(CACHE_PATH), exist_ok=True)
+        temp_path = f"{CACHE_PATH}.{os.getpid()}.tmp"
+        with open(temp_path, 'w', encoding='utf-8') as cache_file:
+            json.dump(_cache, cache_file)
+        os.replace(temp_path, CACHE_PATH)
+        _cache_dirty = False
+    except OSError as e:
+        log.warning(f"Could not save metadata cache to {CACHE_PATH}: {e}")
 
 class ExifEditor:
     """
     Manages reading and writing EXIF metadata for a single file using exiftool.
     """
     EXIFTOOL_COMMAND = "exiftool" # Assumes exiftool is in the system PATH
+    # Extensions exiftool can write EXIF/QuickTime date tags to (subset of its writable formats)
+    WRITABLE_EXTENSIONS = frozenset({
+        '.jpg', '.jpeg', '.jpe', '.mpo', '.thm', '.insp',
+        '.tif', '.tiff', '.png', '.webp', '.heic', '.heif', '.avif', '.jxl', '.jp2', '.psd',
+        '.dng', '.cr2', '.cr3', '.crw', '.nef', '.nrw', '.arw', '.sr2', '.srw', '.orf', '.raf',
+        '.rw2', '.rwl', '.pef', '.erf', '.mef', '.mos', '.mrw', '.iiq', '.x3f', '.gpr',
+        '.mp4', '.mov', '.m4v', '.qt', '.3gp', '.3g2', '.exv', '.mie',
+    })
 
     def __init__(self, file_path: str):
         """
@@ -20,9 +360,14 @@ class ExifEditor:
         Args:
             file_path: The path to the target file.
         """
-        if not os.path.isfile(file_path):
+        try:
+            file_stat = os.stat(file_path)
+        except OSError:
+            file_stat = None
+        if file_stat is None or not stat.S_ISREG(file_stat.st_mode):
             raise FileNotFoundError(f"File not found: {file_path}")
         self.file_path = file_path
+        self._stat_key = (file_stat.st_size, file_stat.st_mtime_ns)
         self._date_time_original = None
         self._user_comment = None
         self._writable = None
@@ -30,7 +375,8 @@ class ExifEditor:
 
     def _run_exiftool(self, args: list) -> tuple[str, str, int]:
         """
-        Runs the exiftool command with the given arguments.
+        Runs the exiftool command with the given arguments through the shared
+        stay-open exiftool process.
 
         Args:
             args: A list of arguments to pass to exiftool.
@@ -38,42 +384,42 @@ class ExifEditor:
         Returns:
             A tuple containing (stdout, stderr, return_code).
         """
-        command = [self.EXIFTOOL_COMMAND] + args + [self.file_path]
-        logging.debug(f"Running command: {' '.join(shlex.quote(str(arg)) for arg in command)}")
+        if log.isEnabledFor(logging.DEBUG):
+            command = [self.EXIFTOOL_COMMAND] + args + [self.file_path]
+            log.debug("Running command: %s", ' '.join(shlex.quote(str(arg)) for arg in command))
         try:
-            process = subprocess.run(
-                command,
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
-                encoding='utf-8', # Assume utf-8 output, adjust if needed
-                errors='replace', # Handle potential decoding errors
-                check=False # Don't raise exception on non-zero exit code
-            )
-            logging.debug(f"Exiftool stdout:\n{process.stdout}")
-            logging.debug(f"Exiftool stderr:\n{process.stderr}")
-            logging.debug(f"Exiftool return code: {process.returncode}")
-            return process.stdout.strip(), process.stderr.strip(), process.returncode
+            stdout, stderr, return_code = get_daemon().run(args + [self.file_path])
+            log.debug("Exiftool stdout:\n%s", stdout)
+            log.debug("Exiftool stderr:\n%s", stderr)
+            log.debug("Exiftool return code: %s", return_code)
+            return stdout.strip(), stderr.strip(), return_code
         except FileNotFoundError:
-            logging.error(f"'{self.EXIFTOOL_COMMAND}' command not found. Please ensure ExifTool is installed and in your PATH.")
+            log.error(f"'{self.EXIFTOOL_COMMAND}' command not found. Please ensure ExifTool is installed and in your PATH.")
             raise
         except Exception as e:
-            logging.error(f"Error running exiftool: {e}")
+            log.error(f"Error running exiftool: {e}")
             return "", str(e), 1 # Simulate an error return
 
     def read_metadata(self) -> bool:
         """
         Reads DateTimeOriginal and UserComment from the file's EXIF data.
 
+        Uses -fast2, which stops exiftool before MakerNotes and trailers. Cameras that
+        keep these tags only in their MakerNotes come back empty with -fast2, so the
+        file is read again with a full scan when neither tag is found.
+
         Returns:
             True if metadata was read successfully, False otherwise.
         """
-        if self._metadata_read:
+        if self._metadata_read or self._load_from_cache():
             return True
 
-        stdout, stderr, return_code = self._run_exiftool(['-s', '-s', '-DateTimeOriginal', '-UserComment'])
+        stdout, stderr, return_code = self._run_exiftool(['-fast2', '-s', '-s', '-DateTimeOriginal', '-UserComment'])
+        if return_code == 0 and not stdout:
+            stdout, stderr, return_code = self._run_exiftool(['-s', '-s', '-DateTimeOriginal', '-UserComment'])
 
         if return_code != 0:
-            logging.warning(f"Exiftool could not read metadata for {self.file_path}. Error: {stderr}")
+            log.warning(f"Exiftool could not read metadata for {self.file_path}. Error: {stderr}")
             return False
 
         lines = stdout.splitlines()
@@ -86,9 +432,154 @@ class ExifEditor:
         self._date_time_original = metadata.get('DateTimeOriginal')
         self._user_comment = metadata.get('UserComment', '') # Default to empty string if not present
         self._metadata_read = True
-        logging.debug(f"Read metadata for {self.file_path}: DateTimeOriginal='{self._date_time_original}', UserComment='{self._user_comment}'")
+        self._store_in_cache()
+        log.debug("Read metadata for %s: DateTimeOriginal='%s', UserComment='%s'", self.file_path, self._date_time_original, self._user_comment)
         return True
 
+    def _load_from_cache(self) -> bool:
+        """Fills the metadata from the cache if the file is unchanged since it was stored."""
+        entry = _load_cache().get(os.path.abspath(self.file_path))
+        if entry is None or (entry.get('size'), entry.get('mtime_ns')) != self._stat_key:
+            return False
+        self._date_time_original = entry.get('DateTimeOriginal')
+        self._user_comment = entry.get('UserComment', '')
+        self._metadata_read = True
+        log.debug("Using cached metadata for %s", self.file_path)
+        return True
+
+    def _store_in_cache(self):
+        """Stores the current metadata in the cache under the file's size and mtime."""
+        global _cache_dirty
+        size, mtime_ns = self._stat_key
+        _load_cache()[os.path.abspath(self.file_path)] = {
+            'size': size,
+            'mtime_ns': mtime_ns,
+            'DateTimeOriginal': self._date_time_original,
+            'UserComment': self._user_comment,
+        }
+        _cache_dirty = True
+
+    def refresh_cache(self):
+        """
+        Re-stats the file and stores the current metadata in the cache.
+        Called after a write, which changes the file's size and mtime.
+        """
+        global _cache_dirty
+        try:
+            file_stat = os.stat(self.file_path)
+        except OSError:
+            _load_cache().pop(os.path.abspath(self.file_path), None)
+            _cache_dirty = True
+            return
+        self._stat_key = (file_stat.st_size, file_stat.st_mtime_ns)
+        self._store_in_cache()
+
+    @classmethod
+    def bulk_read(cls, paths: list[str]) -> dict[str, "ExifEditor"]:
+        """
+        Reads DateTimeOriginal and UserComment for many files with a single exiftool run.
+
+        The paths are handed to exiftool through a temporary argfile (-@) so the
+        command line stays short however many files there are. Files exiftool could
+        not read are returned with their metadata unread, so read_metadata() falls
+        back to reading them individually. As in read_metadata(), the first pass uses
+        -fast2 and files with neither tag are read again with a full scan.
+
+        Args:
+            paths: The paths of the target files.
+
+        Returns:
+            A dict mapping each existing path to its ExifEditor, in the given order.
+        """
+        editors = {}
+        for path in paths:
+            try:
+                editors[path] = cls(path)
+            except FileNotFoundError:
+                continue # Reported by the caller when the path is looked up
+        if not editors:
+            return editors
+
+        uncached = [editor for editor in editors.values() if not editor._load_from_cache()]
+        if not uncached:
+            return editors
+
+        cls._read_json(uncached, ['-fast2'])
+        rescan = [editor for editor in uncached
+                  if editor._metadata_read and not editor._date_time_original and not editor._user_comment]
+        if rescan:
+            cls._read_json(rescan, [])
+
+        return editors
+
+    @classmethod
+    def _run_exiftool_bulk(cls, args_prefix: list, arg_lines: list[str]) -> tuple[str, str, int]:
+        """
+        Runs exiftool once with arg_lines (paths or options, one per line) passed through
+        a temporary argfile (-@). This keeps the command line short regardless of the number
+        of files, and paths with spaces or non-ASCII characters need no escaping. Values
+        with line breaks are written as escaped '#[CSTR]' lines (see _argfile_text).
+
+        Args:
+            args_prefix: Arguments placed on the command line before the argfile.
+            arg_lines: Arguments written to the argfile.
+
+        Returns:
+            A tuple containing (stdout, stderr, return_code).
+        """
+        with tempfile.NamedTemporaryFile('w', encoding='utf-8', suffix='.txt', delete=False) as arg_file:
+            arg_file.write(_argfile_text(arg_lines))
+        # -common_args applies the charset to every -execute group, not just the first
+        command = [cls.EXIFTOOL_COMMAND, *args_prefix, '-@', arg_file.name, '-common_args', *_CHARSET_ARGS]
+        if log.isEnabledFor(logging.DEBUG):
+            log.debug("Running command: %s", ' '.join(shlex.quote(str(arg)) for arg in command))
+        try:
+            process = subprocess.run(
+                command,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.PIPE,
+                encoding='utf-8',
+                errors='replace',
+                check=False
+            )
+        except FileNotFoundError:
+            log.error(f"'{cls.EXIFTOOL_COMMAND}' command not found. Please ensure ExifTool is installed and in your PATH.")
+            raise
+        finally:
+            os.unlink(arg_file.name)
+        log.debug("Exiftool stdout:\n%s", process.stdout)
+        log.debug("Exiftool stderr:\n%s", process.stderr)
+        log.debug("Exiftool return code: %s", process.returncode)
+        return process.stdout, process.stderr, process.returncode
+
+    @classmethod
+    def _read_json(cls, editors: list["ExifEditor"], extra_args: list[str]):
+        """Fills the editors' metadata from one 'exiftool -j' run over all their files."""
+        stdout, _, _ = cls._run_exiftool_bulk(
+            ['-j', *extra_args, '-s', '-DateTimeOriginal', '-UserComment'],
+            [editor.file_path for editor in editors]
+        )
+
+        try:
+            # exiftool emits numeric-looking values as JSON numbers; keep their original text (e.g. "1.50")
+            entries = json.loads(stdout, parse_int=str, parse_float=str) if stdout.strip() else []
+        except json.JSONDecodeError as e:
+            log.warning(f"Could not parse exiftool JSON output: {e}")
+            entries = []
+
+        # exiftool may rewrite separators in SourceFile (e.g. on Windows), so match normalized paths
+        by_path = {os.path.normcase(os.path.normpath(editor.file_path)): editor for editor in editors}
+        for entry in entries:
+            editor = by_path.get(os.path.normcase(os.path.normpath(entry.get('SourceFile', ''))))
+            if editor is None or 'Error' in entry:
+                continue
+            date_time_original = entry.get('DateTimeOriginal')
+            editor._date_time_original = str(date_time_original) if date_time_original is not None else None
+            editor._user_comment = str(entry.get('UserComment', ''))
+            editor._metadata_read = True
+            editor._store_in_cache()
+            log.debug("Read metadata for %s: DateTimeOriginal='%s', UserComment='%s'", editor.file_path, editor._date_time_original, editor._user_comment)
+
     @property
     def date_time_original(self) -> str | None:
         """Returns the DateTimeOriginal tag value (reads if necessary)."""
@@ -108,27 +599,23 @@ class ExifEditor:
     def is_writable(self) -> bool:
         """
         Checks if the file is writable by the user and likely supported by exiftool.
-        Relies on a test write command succeeding.
+        Relies on OS permissions and the file extension; a failing write is still
+        caught by exiftool's return code in update_datetime_and_comment.
         """
         if self._writable is not None:
             return self._writable
 
         if not os.access(self.file_path, os.W_OK):
-            logging.warning(f"File is not writable (OS permissions): {self.file_path}")
+            log.warning(f"File is not writable (OS permissions): {self.file_path}")
             self._writable = False
             return False
 
-        # Attempt a harmless write to check exiftool support/write capability
-        # Writing an empty comment shouldn't change much if it doesn't exist
-        # or overwrite if it does (but we restore later if needed).
-        # Using -m (ignore minor errors) to handle warnings about existing tags etc.
-        _, stderr, return_code = self._run_exiftool(['-m', '-overwrite_original_in_place', '-UserComment='])
-
-        if return_code == 0:
-            logging.debug(f"File appears writable by exiftool: {self.file_path}")
+        extension = os.path.splitext(self.file_path)[1].lower()
+        if extension in self.WRITABLE_EXTENSIONS:
+            log.debug("File appears writable by exiftool: %s", self.file_path)
             self._writable = True
         else:
-            logging.warning(f"File may not be supported or writable by exiftool: {self.file_path}. Error: {stderr}")
+            log.warning(f"File type is not supported for writing by exiftool: {self.file_path}")
             self._writable = False
 
         return self._writable
@@ -144,19 +631,47 @@ class ExifEditor:
         Returns:
             True if the update was successful, False otherwise.
         """
+        prepared = self._prepare_update(new_datetime_str, comment_addition)
+        if prepared is None:
+            return False
+        new_comment, args = prepared
+        stdout, stderr, return_code = self._run_exiftool(args)
+        return self._finish_update(new_datetime_str, new_comment, stdout, stderr, return_code)
+
+    async def update_datetime_and_comment_async(self, new_datetime_str: str, comment_addition: str,
+                                                daemon: "AsyncExifToolDaemon") -> bool:
+        """
+        Same as update_datetime_and_comment, but sends the write through an
+        AsyncExifToolDaemon so that many files can be in flight at once.
+
+        Args:
+            new_datetime_str: The new timestamp in "YYYY:MM:DD HH:MM:SS" format.
+            comment_addition: The string to append to the existing UserComment.
+            daemon: The running exiftool process to send the command to.
+
+        Returns:
+            True if the update was successful, False otherwise.
+        """
+        prepared = self._prepare_update(new_datetime_str, comment_addition)
+        if prepared is None:
+            return False
+        new_comment, args = prepared
+        stdout, stderr, return_code = await daemon.run(args + [self.file_path])
+        return self._finish_update(new_datetime_str, new_comment, stdout.strip(), stderr.strip(), return_code)
+
+    def _prepare_update(self, new_datetime_str: str, comment_addition: str) -> tuple[str, list] | None:
+        """Returns (new_comment, exiftool args) for an update, or None if the file can't be written."""
         if not self.is_writable():
-             logging.warning(f"Attempted to write to non-writable file: {self.file_path}")
-             return False
+             log.warning(f"Attempted to write to non-writable file: {self.file_path}")
+             return None
 
         # Ensure metadata is read before constructing the new comment
         if not self._metadata_read:
             if not self.read_metadata():
-                 logging.error(f"Failed to read metadata before writing to {self.file_path}")
-                 return False # Cannot proceed without knowing original comment
+                 log.error(f"Failed to read metadata before writing to {self.file_path}")
+                 return None # Cannot proceed without knowing original comment
 
-        current_comment = self.user_comment
-        separator = " " if current_comment and comment_addition else ""
-        new_comment = f"{current_comment}{separator}{comment_addition}"
+        new_comment = self._append_comment(comment_addition)
 
         # Use -m to ignore minor errors (like tag not existing initially)
         # Use -overwrite_original_in_place for efficiency
@@ -166,23 +681,109 @@ class ExifEditor:
             f'-DateTimeOriginal={new_datetime_str}',
             f'-UserComment={new_comment}'
         ]
-        stdout, stderr, return_code = self._run_exiftool(args)
+        return new_comment, args
 
+    def _finish_update(self, new_datetime_str: str, new_comment: str, stdout: str, stderr: str, return_code: int) -> bool:
+        """Logs the outcome of an update and records the new state on success."""
         if return_code == 0:
-            logging.info(f"Successfully updated EXIF for {self.file_path}")
-            # Update internal state
-            self._date_time_original = new_datetime_str
-            self._user_comment = new_comment
+            log.info(f"Successfully updated EXIF for {self.file_path}")
+            self._record_update(new_datetime_str, new_comment)
             return True
         else:
-            logging.error(f"Failed to update EXIF for {self.file_path}. Error: {stderr}\nStdout: {stdout}")
+            log.error(f"Failed to update EXIF for {self.file_path}. Error: {stderr}\nStdout: {stdout}")
             return False
 
+    def _append_comment(self, comment_addition: str) -> str:
+        """Returns the existing UserComment with comment_addition appended."""
+        current_comment = self.user_comment
+        separator = " " if current_comment and comment_addition else ""
+        return f"{current_comment}{separator}{comment_addition}"
+
+    def _record_update(self, new_datetime_str: str, new_comment: str):
+        """Updates the internal state after a successful write."""
+        self._date_time_original = new_datetime_str
+        self._user_comment = new_comment
+        if _cache_enabled:
+            self.refresh_cache()
+
+    @classmethod
+    def bulk_update(cls, updates: list[tuple["ExifEditor", str, str]]) -> dict[str, bool]:
+        """
+        Updates DateTimeOriginal and appends to the UserComment of many files with a
+        single exiftool run.
+
+        Each file gets its own -execute group in a temporary argfile, followed by
+        -echo3/-echo4 markers carrying the group's exit status, so success can still
+        be reported per file.
+
+        Args:
+            updates: (editor, new_datetime_str, comment_addition) tuples, one per file.
+
+        Returns:
+            A dict mapping each file path to True if its update succeeded.
+        """
+        results = {}
+        groups = [] # (editor, new_datetime_str, new_comment) for each file sent to exiftool
+        arg_lines = [] # One -execute group per file
+        for editor, new_datetime_str, comment_addition in updates:
+            results[editor.file_path] = False
+            prepared = editor._prepare_update(new_datetime_str, comment_addition)
+            if prepared is None:
+                continue
+            new_comment, args = prepared
+            marker = f"{{done{len(groups)}:${{status}}}}"
+            if groups:
+                arg_lines.append('-execute')
+            groups.append((editor, new_datetime_str, new_comment))
+            arg_lines.extend(args + [editor.file_path, '-echo3', marker, '-echo4', marker])
+        if not groups:
+            return results
+
+        stdout, stderr, _ = cls._run_exiftool_bulk([], arg_lines)
+
+        stdout_chunks = cls._split_marked_output(stdout)
+        stderr_chunks = cls._split_marked_output(stderr)
+        for index, (editor, new_datetime_str, new_comment) in enumerate(groups):
+            status, stdout = stdout_chunks.get(index, (None, ""))
+            stderr = stderr_chunks.get(index, (None, ""))[1]
+            if status is None:
+                success = False
+            elif status.isdigit():
+                success = status == '0'
+            else:
+                # Older exiftool versions don't expand ${status}; fall back to the counters
+                success = re.search(r'\b1 image files updated', stdout) is not None
+            if success:
+                log.info(f"Successfully updated EXIF for {editor.file_path}")
+                editor._record_update(new_datetime_str, new_comment)
+            else:
+                log.error(f"Failed to update EXIF for {editor.file_path}. Error: {stderr.strip()}\nStdout: {stdout.strip()}")
+            results[editor.file_path] = success
+        return results
+
+    @staticmethod
+    def _split_marked_output(output: str) -> dict[int, tuple[str, str]]:
+        """Splits exiftool output on {doneN:status} markers into {N: (status, preceding text)}."""
+        chunks = {}
+        lines = []
+        for line in output.splitlines():
+            match = re.fullmatch(r'\{done(\d+):(.*)\}', line.strip())
+            if match:
+                chunks[int(match.group(1))] = (match.group(2), "\n".join(lines))
+                lines = []
+            else:
+                lines.append(line)
+        return chunks
+
     @staticmethod
     def is_valid_datetime_format(dt_str: str) -> bool:
         """Checks if a string matches the 'YYYY:MM:DD HH:MM:SS' format."""
+        match = _DT_RE.fullmatch(dt_str)
+        if not match:
+            return False
         try:
-            ExifEditor.parse_datetime(dt_str)
+            # The regex only checks the syntax; this rejects dates like Feb 30th
+            datetime.datetime(*map(int, match.groups()))
             return True
         except ValueError:
             return False
@@ -195,4 +796,5 @@ class ExifEditor:
     @staticmethod
     def format_datetime(dt_obj: datetime.datetime) -> str:
         """Formats a datetime object into 'YYYY:MM:DD HH:MM:SS' string."""
-        return dt_obj.strftime('%Y:%m:%d %H:%M:%S')
\ No newline at end of file
+        # Plain integer formatting; strftime re-parses its format string on every call
+        return f"{dt_obj.year:04d}:{dt_obj.month:02d}:{dt_obj.day:02d} {dt_obj.hour:02d}:{dt_obj.minute:02d}:{dt_obj.second:02d}"
\ No newline at end of file
@@ -4,11 +4,23 @@ import glob
 import argparse
 import datetime
 import os
+import re
+import atexit
+import asyncio
 import logging
-from exif_editor import ExifEditor # Import the refactored class
+import logging.handlers
+import multiprocessing
+import multiprocessing.util
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from exif_editor import AsyncExifToolDaemon, ExifEditor, disable_cache, save_cache # Import the refactored class
 
 # Configure logging (can be adjusted, e.g., add file logging)
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+log = logging.getLogger(__name__)
+
+WORKER_CHUNK_SIZE = 50 # Files handed to a worker process per task
+# Matches the comment left by a previous run and captures the timestamp it set
+FIX_COMMENT_PATTERN = re.compile(r'AdjustedDateTime_\w+\[[^\]]* -> ([^\]]*)\]')
 
 def parse_arguments():
     """Parses command-line arguments."""
@@ -41,16 +53,19 @@ Notes:
         action='store_true',
         help="Perform a dry run: show what changes would be made without actually modifying files."
     )
+    parser.add_argument(
+        '--workers',
+        type=int,
+        default=min(4, os.cpu_count() or 1),
+        help="Number of worker processes used to write files (default: min(4, CPU count)). Use 1 to write all files in a single exiftool run."
+    )
     parser.add_argument(
         '--verbose', '-v',
         action='store_true',
         help="Enable verbose logging (DEBUG level)."
     )
 
-    if len(sys.argv) < 4:
-        parser.print_help()
-        sys.exit(1)
-
+    # argparse reports missing positional arguments itself
     args = parser.parse_args()
 
     # Set logging level based on verbosity
@@ -59,13 +74,17 @@ Notes:
 
     # Validate start_time format using the method from ExifEditor
     if not ExifEditor.is_valid_datetime_format(args.start_time):
-        logging.error(f"Invalid start_time format: '{args.start_time}'. Expected 'YYYY:MM:DD HH:MM:SS'.")
+        log.error(f"Invalid start_time format: '{args.start_time}'. Expected 'YYYY:MM:DD HH:MM:SS'.")
         parser.print_help()
         sys.exit(1)
 
+    if args.workers < 1:
+        log.error(f"Invalid number of workers: {args.workers}. Must be at least 1.")
+        sys.exit(1)
+
     # Validate directory existence
     if not os.path.isdir(args.directory):
-        logging.error(f"Directory not found: {args.directory}")
+        log.error(f"Directory not found: {args.directory}")
         sys.exit(1)
 
     return args
@@ -73,95 +92,228 @@ Notes:
 def get_sorted_files(directory: str, sort_key: str) -> list[str]:
     """Gets and sorts files from the directory based on the specified key."""
     try:
-        # Use recursive=False to only get files directly in the folder
-        files = [os.path.join(directory, f) for f in os.listdir(directory) if os.path.isfile(os.path.join(directory, f))]
-        # files = glob.glob(os.path.join(directory, "*")) # Original glob approach (includes subdirs if not filtered)
-        # files = [f for f in files if os.path.isfile(f)] # Filter out directories if using glob
+        # scandir only lists files directly in the folder, and its entries cache stat results
+        with os.scandir(directory) as it:
+            entries = [entry for entry in it if entry.is_file()]
     except FileNotFoundError:
-        logging.error(f"Error accessing directory: {directory}")
+        log.error(f"Error accessing directory: {directory}")
         return [] # Return empty list on error
 
-    if not files:
-        logging.warning(f"No files found in directory: {directory}")
+    if not entries:
+        log.warning(f"No files found in directory: {directory}")
         return []
 
     if sort_key == 'name':
-        files.sort()
+        entries.sort(key=lambda entry: entry.path)
     elif sort_key == 'created':
-        files.sort(key=os.path.getctime)
+        entries.sort(key=lambda entry: entry.stat().st_ctime)
     elif sort_key == 'modified':
-        files.sort(key=os.path.getmtime)
+        entries.sort(key=lambda entry: entry.stat().st_mtime)
+    files = [entry.path for entry in entries]
 
-    logging.info(f"Found {len(files)} files, sorted by {sort_key}.")
+    log.info(f"Found {len(files)} files, sorted by {sort_key}.")
     return files
 
-def process_files(files: list[str], start_dt: datetime.datetime, interval_sec: float, fix_id: str, dry_run: bool):
+def build_schedule(start_dt: datetime.datetime, interval_sec: float, count: int) -> list[str]:
+    """
+    Precomputes the formatted timestamps for file indices 0..count-1 in one pass,
+    stepping by a fixed whole-microsecond delta instead of multiplying per index.
+    The list stops early at the first timestamp outside datetime's range.
+    """
+    step = datetime.timedelta(microseconds=round(interval_sec * 1_000_000))
+    schedule = []
+    current_dt = start_dt
+    try:
+        for index in range(count):
+            if index:
+                current_dt += step
+            schedule.append(ExifEditor.format_datetime(current_dt))
+    except OverflowError:
+        pass # process_files reports the files past the end of the schedule
+    return schedule
+
+def fix_id_already_in_comment(user_comment: str, new_datetime_str: str) -> bool:
+    """Checks whether a previous run's comment already records an adjustment to new_datetime_str."""
+    return new_datetime_str in FIX_COMMENT_PATTERN.findall(user_comment)
+
+# Each worker process keeps one event loop and one stay-open exiftool across its chunks
+_worker_loop = None
+_worker_daemon = None
+
+def _init_worker(log_queue, log_level: int):
+    """
+    Sends a worker process's log records to the main process through log_queue and
+    sets up the worker's event loop and exiftool daemon, which are closed on exit.
+    """
+    global _worker_loop, _worker_daemon
+    root_logger = logging.getLogger()
+    root_logger.handlers[:] = [logging.handlers.QueueHandler(log_queue)]
+    root_logger.setLevel(log_level)
+    disable_cache() # The main process refreshes the cache from the returned editors
+    _worker_loop = asyncio.new_event_loop()
+    _worker_daemon = AsyncExifToolDaemon(ExifEditor.EXIFTOOL_COMMAND)
+    multiprocessing.util.Finalize(None, _close_worker, exitpriority=10)
+
+def _close_worker():
+    """Shuts down the worker's exiftool and event loop when the worker process exits."""
+    _worker_loop.run_until_complete(_worker_daemon.close())
+    _worker_loop.close()
+
+async def _update_chunk_async(chunk: list[tuple[ExifEditor, str, str]], daemon: AsyncExifToolDaemon) -> list[tuple[ExifEditor, bool]]:
+    """Sends every update in the chunk to exiftool at once and gathers the results in order."""
+    results = await asyncio.gather(*[
+        editor.update_datetime_and_comment_async(new_datetime_str, fix_comment, daemon)
+        for editor, new_datetime_str, fix_comment in chunk
+    ], return_exceptions=True)
+
+    chunk_results = []
+    for (editor, _, _), result in zip(chunk, results):
+        if isinstance(result, Exception):
+            log.error(f"Failed to update EXIF for {editor.file_path}. Error: {result}")
+            result = False
+        chunk_results.append((editor, result))
+    return chunk_results
+
+def _update_chunk(chunk: list[tuple[ExifEditor, str, str]]) -> list[tuple[ExifEditor, bool]]:
+    """
+    Writes a chunk of updates in a worker process through its own stay-open exiftool.
+    The updated editors are returned so the main process can refresh its metadata cache.
+    """
+    return _worker_loop.run_until_complete(_update_chunk_async(chunk, _worker_daemon))
+
+def update_files_parallel(updates: list[tuple[ExifEditor, str, str]], workers: int) -> dict[str, bool]:
+    """Shards the updates across worker processes and collects per-file results."""
+    chunks = [updates[i:i + WORKER_CHUNK_SIZE] for i in range(0, len(updates), WORKER_CHUNK_SIZE)]
+    root_logger = logging.getLogger()
+    log_queue = multiprocessing.Queue()
+    # Only the main process writes log output, so lines from different workers don't interleave
+    listener = logging.handlers.QueueListener(log_queue, *root_logger.handlers, respect_handler_level=True)
+    listener.start()
+    results = {}
+    try:
+        with ProcessPoolExecutor(max_workers=min(workers, len(chunks)), initializer=_init_worker, initargs=(log_queue, root_logger.level)) as executor:
+            futures = {executor.submit(_update_chunk, chunk): chunk for chunk in chunks}
+            for future in as_completed(futures):
+                try:
+                    for editor, success in future.result():
+                        results[editor.file_path] = success
+                        if success:
+                            editor.refresh_cache()
+                except Exception as e:
+                    log.error(f"Error in worker process: {e}", exc_info=log.isEnabledFor(logging.DEBUG))
+                    results.update({editor.file_path: False for editor, _, _ in futures[future]})
+    finally:
+        listener.stop()
+    return results
+
+def process_files(files: list[str], start_dt: datetime.datetime, interval_sec: float, fix_id: str, dry_run: bool, workers: int = 1):
     """Processes each file, adjusting the timestamp."""
     processed_count = 0
     skipped_count = 0
     error_count = 0
-    file_index = 0  # Counter for successfully processed files
-    interval_delta = datetime.timedelta(seconds=interval_sec)
+    file_index = 0  # Counter for files scheduled for an update
+    schedule = build_schedule(start_dt, interval_sec, len(files))  # New timestamp for every possible file_index
+    updates = []  # (editor, new_datetime_str, fix_comment) for the write pass
+    debug_enabled = log.isEnabledFor(logging.DEBUG)  # Tracebacks are only logged when verbose
+
+    # Read metadata for every file in one exiftool run instead of one run per file
+    try:
+        editors = ExifEditor.bulk_read(files)
+    except FileNotFoundError:
+        sys.exit(1) # exiftool is not installed; bulk_read has already logged why
+    except OSError as e:
+        log.warning(f"Could not read metadata in one exiftool run, reading files one by one: {e}")
+        editors = {}
 
+    # Phase 1: work out the new timestamp and comment for each file (no writes)
     for index, file_path in enumerate(files):
         filename = os.path.basename(file_path)
-        logging.info(f"Processing [{index + 1}/{len(files)}] {filename}...")  # Still use 'index' for total file count
+        # Lines for this file are collected and logged as a single record
+        msg_lines = [f"Processing [{index + 1}/{len(files)}] {filename}..."]  # Still use 'index' for total file count
 
         try:
-            editor = ExifEditor(file_path)
+            editor = editors[file_path] if file_path in editors else ExifEditor(file_path)
 
             # Read existing metadata first
             if not editor.read_metadata():
-                logging.warning(f"Skipping {filename}: Could not read initial metadata.")
+                msg_lines.append(f"  Skipping {filename}: Could not read initial metadata.")
+                log.warning("\n".join(msg_lines))
                 skipped_count += 1
                 continue # Skip if we can't even read it
 
             # Check writability *after* reading, as reading might still be useful
             if not dry_run and not editor.is_writable():
-                logging.warning(f"Skipping {filename}: File is not writable or not supported by exiftool.")
+                msg_lines.append(f"  Skipping {filename}: File is not writable or not supported by exiftool.")
+                log.warning("\n".join(msg_lines))
                 skipped_count += 1
                 continue
 
-            # Calculate new timestamp based on the number of *processed* files
-            current_dt = start_dt + (interval_delta * file_index)
-            new_datetime_str = ExifEditor.format_datetime(current_dt)
+            # Calculate new timestamp based on the number of files scheduled so far
+            if file_index >= len(schedule):
+                raise OverflowError("New timestamp is outside the supported date range")
+            new_datetime_str = schedule[file_index]
+            file_index += 1
+
+            # Already adjusted to this timestamp by an earlier run; rewriting would only re-mux the file
+            if editor.date_time_original == new_datetime_str and fix_id_already_in_comment(editor.user_comment, new_datetime_str):
+                msg_lines.append(f"  Unchanged, skipping {filename}")
+                log.info("\n".join(msg_lines))
+                skipped_count += 1
+                continue
 
             original_dt_str = editor.date_time_original if editor.date_time_original else "None"
 
             # Create comment (ensure quotes are handled if necessary, though ExifEditor should manage this)
             fix_comment = f"AdjustedDateTime_{fix_id}[{original_dt_str} -> {new_datetime_str}]"
 
-            logging.info(f"  Original DateTime: {original_dt_str}")
-            logging.info(f"  Calculated New DateTime: {new_datetime_str}")
-            logging.info(f"  Comment to add: {fix_comment}")
-
+            msg_lines.append(f"  Original DateTime: {original_dt_str}")
+            msg_lines.append(f"  Calculated New DateTime: {new_datetime_str}")
+            msg_lines.append(f"  Comment to add: {fix_comment}")
 
             if dry_run:
-                logging.info(f"  DRY RUN: Would update {filename}")
+                msg_lines.append(f"  DRY RUN: Would update {filename}")
                 processed_count += 1 # Count as processed in dry run
             else:
-                # Write EXIF data using the refactored method
-                if editor.update_datetime_and_comment(new_datetime_str, fix_comment):
-                    logging.info(f"  Successfully updated {filename}")
-                    processed_count += 1
-                    file_index += 1  # Increment only on successful processing
-                else:
-                    logging.error(f"  Failed to update {filename}")
-                    error_count += 1
+                updates.append((editor, new_datetime_str, fix_comment))
+            log.info("\n".join(msg_lines))
 
         except FileNotFoundError:
-            logging.error(f"Error processing {filename}: File not found (should not happen if initial check passed).")
+            msg_lines.append(f"  Error processing {filename}: File not found (should not happen if initial check passed).")
+            log.error("\n".join(msg_lines))
             error_count += 1
         except Exception as e:
-            logging.error(f"Error processing {filename}: {e}", exc_info=logging.getLogger().level == logging.DEBUG) # Show traceback if verbose
+            msg_lines.append(f"  Error processing {filename}: {e}")
+            log.error("\n".join(msg_lines), exc_info=debug_enabled) # Show traceback if verbose
             error_count += 1
 
+    # Phase 2: write the files, sharded across workers for large batches or in a single exiftool run
+    if updates:
+        try:
+            if workers > 1 and len(updates) > WORKER_CHUNK_SIZE:
+                results = update_files_parallel(updates, workers)
+            else:
+                results = ExifEditor.bulk_update(updates)
+        except Exception as e:
+            log.error(f"Error writing EXIF data: {e}", exc_info=debug_enabled)
+            results = {}
+        success_lines = []
+        for editor, _, _ in updates:
+            filename = os.path.basename(editor.file_path)
+            if results.get(editor.file_path):
+                success_lines.append(f"  Successfully updated {filename}")
+                processed_count += 1
+            else:
+                log.error(f"  Failed to update {filename}")
+                error_count += 1
+        if success_lines:
+            log.info("\n".join(success_lines))
+
     print("-" * 30)
-    logging.info("Processing Summary:")
-    logging.info(f"  Total Files Attempted: {len(files)}")
-    logging.info(f"  Successfully Processed{' (Dry Run)' if dry_run else ''}: {processed_count}")
-    logging.info(f"  Skipped (Read Error/Not Writable): {skipped_count}")
-    logging.info(f"  Errors: {error_count}")
+    log.info("Processing Summary:")
+    log.info(f"  Total Files Attempted: {len(files)}")
+    log.info(f"  Successfully Processed{' (Dry Run)' if dry_run else ''}: {processed_count}")
+    log.info(f"  Skipped (Read Error/Not Writable/Unchanged): {skipped_count}")
+    log.info(f"  Errors: {error_count}")
     print("-" * 30)
 
 
@@ -172,33 +324,35 @@ def main():
     print("+-----------------------------+")
 
     args = parse_arguments()
+    atexit.register(save_cache) # Persist metadata read during this run once, on exit
 
     fix_id = str(int(time.time())) # Unique ID for this run's comments
-    logging.info(f"Starting run with Fix ID: {fix_id}")
-    logging.info(f"Target Directory: {args.directory}")
-    logging.info(f"Start Time: {args.start_time}")
-    logging.info(f"Interval: {args.interval} seconds")
-    logging.info(f"Sort By: {args.sort_by}")
+    log.info(f"Starting run with Fix ID: {fix_id}")
+    log.info(f"Target Directory: {args.directory}")
+    log.info(f"Start Time: {args.start_time}")
+    log.info(f"Interval: {args.interval} seconds")
+    log.info(f"Sort By: {args.sort_by}")
+    log.info(f"Workers: {args.workers}")
     if args.dry_run:
-        logging.warning("--- DRY RUN MODE ENABLED: No files will be modified. ---")
+        log.warning("--- DRY RUN MODE ENABLED: No files will be modified. ---")
 
     try:
         start_datetime_obj = ExifEditor.parse_datetime(args.start_time)
     except ValueError as e:
          # This case should ideally be caught by is_valid_datetime_format earlier,
          # but catch it here just in case of edge cases (e.g., invalid date like Feb 30th)
-         logging.error(f"Error parsing start_time '{args.start_time}': {e}")
+         log.error(f"Error parsing start_time '{args.start_time}': {e}")
          sys.exit(1)
 
 
     files_to_process = get_sorted_files(args.directory, args.sort_by)
 
     if not files_to_process:
-        logging.info("No files to process. Exiting.")
+        log.info("No files to process. Exiting.")
         sys.exit(0)
 
     print("-" * 30) # Separator before processing starts
-    process_files(files_to_process, start_datetime_obj, args.interval, fix_id, args.dry_run)
+    process_files(files_to_process, start_datetime_obj, args.interval, fix_id, args.dry_run, args.workers)
 
     if args.dry_run:
         print("--- DRY RUN COMPLETE ---")